@@ -1,12 +1,66 @@
 import os
-import csv
+import stat
 import time
+import atexit
+import logging
+import threading
+from functools import cached_property
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
-import yfinance as yf
+import pandas as pd
 import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    import json
+
+    def _json_dumps(obj):
+        return json.dumps(obj).encode()
+
+    _json_loads = json.loads
+
+
+def _build_session(pool_connections=10, pool_maxsize=50, retry=None, user_agent=None):
+    """
+    Returns a requests Session with connection pooling and retries.
+    By default 429/5xx responses to idempotent requests are retried with backoff.
+    """
+    session = requests.Session()
+    if retry is None:
+        retry = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            respect_retry_after_header=True,
+        )
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    if user_agent:
+        session.headers["User-Agent"] = user_agent
+    return session
+
+
+# Shared by all Yahoo Finance calls; Yahoo rejects the default requests User-Agent
+_SESSION = _build_session(
+    user_agent=(
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/124.0 Safari/537.36"
+    )
+)
+
+logger = logging.getLogger("market_alert")
+
+_HTML_ROW = "<tr><td>{}</td><td>{}</td><td>{}</td></tr>"
+_TEXT_ROW = "{:<8} | {:<12} | {}"
 
 class EmailTemplate:
     """
@@ -15,7 +69,8 @@ class EmailTemplate:
 
     SUBJECT_TEMPLATE = "Pre-market Alert for {date}"
 
-    HTML_BODY_TEMPLATE = """\
+    # HTML body is split around the rows so it is never re-parsed as one big template
+    HTML_HEAD = """\
 <html>
   <body>
     <p>Number of tickers: <b>{count}</b></p>
@@ -25,7 +80,9 @@ class EmailTemplate:
         <th>Avg Buy Rate</th>
         <th>Pre-market Price</th>
       </tr>
-      {rows}
+      """
+
+    HTML_TAIL = """
     </table>
   </body>
 </html>
@@ -48,40 +105,63 @@ Ticker   | Avg Buy Rate | Pre-market Price
         return EmailTemplate.SUBJECT_TEMPLATE.format(date=date)
 
     @staticmethod
-    def build_body(date, ticker_data, count):
+    def build_body(date, symbols, avg_rates, prices, count):
         """
         Returns the formatted email body.
         :param date: string in DD-MMM-YYYY format
-        :param ticker_data: list of tuples (ticker, avg_buy_rate, pre_market_price)
+        :param symbols: list of tickers
+        :param avg_rates: list of avg buy rates, parallel to symbols
+        :param prices: list of pre-market prices (None if unavailable), parallel to symbols
         """
-        row_lines = []
-        for ticker, avg_buy, pre_market in ticker_data:
-            row_lines.append(f"{ticker:<8} | {avg_buy:<12} | {pre_market if pre_market is not None else 'N/A'}")
-        rows = "\n".join(row_lines)
+        fmt = _TEXT_ROW.format
+        na = "N/A"
+        rows = "\n".join(
+            fmt(ticker, avg_buy, na if pre_market is None else pre_market)
+            for ticker, avg_buy, pre_market in zip(symbols, avg_rates, prices)
+        )
         return EmailTemplate.BODY_TEMPLATE.format(date=date,  count=count,rows=rows)
     
     @staticmethod
-    def build_html_body(date, ticker_data, count):
-        row_lines = []
-        for ticker, avg_buy, pre_market in ticker_data:
-            row_lines.append(
-                f"<tr><td>{ticker}</td><td>{avg_buy}</td><td>{pre_market if pre_market is not None else 'N/A'}</td></tr>"
-            )
-        rows = "\n".join(row_lines)
-        return EmailTemplate.HTML_BODY_TEMPLATE.format(date=date, count=count, rows=rows)
+    def build_html_body(date, symbols, avg_rates, prices, count):
+        """
+        Returns the formatted HTML email body.
+        Takes the same parallel lists as build_body.
+        """
+        fmt = _HTML_ROW.format
+        na = "N/A"
+        rows = "\n".join(
+            fmt(ticker, avg_buy, na if pre_market is None else pre_market)
+            for ticker, avg_buy, pre_market in zip(symbols, avg_rates, prices)
+        )
+        return "".join([EmailTemplate.HTML_HEAD.format(count=count), rows, EmailTemplate.HTML_TAIL])
     
 class InfobipSmsAlert:
+    TIMEOUT = (3.05, 10)  # (connect, read) seconds
+
     def __init__(self, api_key, base_url):
         self.api_key = api_key
         self.base_url = base_url
-
-    def send_infobip_sms(self, sender, recipient, text):
-        url = f"https://2m435w.api.infobip.com/sms/2/text/advanced"
-        headers = {
+        self._url = f"https://2m435w.{base_url}/sms/2/text/advanced"
+        # Retry POSTs only on connection errors and 429: neither means the SMS
+        # was accepted, so a retry cannot send a duplicate. 5xx and read
+        # timeouts are not retried.
+        retry = Retry(
+            total=3,
+            read=0,
+            backoff_factor=0.3,
+            status_forcelist=[429],
+            allowed_methods=frozenset({"POST"}),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        self.session = _build_session(pool_connections=2, pool_maxsize=4, retry=retry)
+        self.session.headers.update({
             "Authorization": f"App {self.api_key}",
             "Content-Type": "application/json",
             "Accept": "application/json"
-        }
+        })
+
+    def send_infobip_sms(self, sender, recipient, text):
         payload = {
             "messages": [
             {
@@ -91,9 +171,12 @@ class InfobipSmsAlert:
             }
                         ]
                 }
-        response = requests.post(url, json=payload, headers=headers)
-        print("Status:", response.status_code)
-        print("Response:", response.json())
+        response = self.session.post(self._url, data=_json_dumps(payload), timeout=self.TIMEOUT)
+        if response.ok:
+            logger.debug("SMS sent. Status: %s", response.status_code)
+            logger.debug("Response: %s", response.text)
+        else:
+            logger.warning("Failed to send SMS. Status: %s, response: %s", response.status_code, response.text)
         return response
         
 class EmailAlert:
@@ -106,6 +189,56 @@ class EmailAlert:
         self.smtp_port = smtp_port
         self.from_email = from_email
         self.from_password = from_password
+        self._persistent = False
+        self._server = None
+
+    def __enter__(self):
+        """
+        Reuse one SMTP session for every send() until exit.
+        The connection is opened lazily on the first send, since the first
+        scheduled window may be hours away.
+        """
+        self._persistent = True
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._persistent = False
+        server, self._server = self._server, None
+        if server is not None:
+            try:
+                server.quit()
+            except (smtplib.SMTPException, OSError):
+                pass
+        return False
+
+    def _connect(self):
+        """
+        Connect, upgrade to TLS and log in.
+        """
+        server = smtplib.SMTP(self.smtp_server, self.smtp_port)
+        server.starttls()
+        server.login(self.from_email, self.from_password)
+        return server
+
+    def _live_server(self):
+        """
+        Return the persistent session, connecting on first use and
+        reconnecting if the server dropped it.
+        """
+        if self._server is not None:
+            try:
+                code, _ = self._server.noop()
+            except (smtplib.SMTPServerDisconnected, OSError):
+                code = None
+            if code != 250:
+                try:
+                    self._server.close()
+                except OSError:
+                    pass
+                self._server = None
+        if self._server is None:
+            self._server = self._connect()
+        return self._server
 
     def send(self, to_email, subject, body=None, html_body=None):
         msg =  MIMEMultipart("alternative")
@@ -118,14 +251,90 @@ class EmailAlert:
             msg.attach(MIMEText(html_body, 'html'))
       
         try:
-            server = smtplib.SMTP(self.smtp_server, self.smtp_port)
-            server.starttls()
-            server.login(self.from_email, self.from_password)
-            server.send_message(msg)
-            server.quit()
-            print("Email sent successfully.")
+            if self._persistent:
+                self._live_server().send_message(msg)
+            else:
+                server = self._connect()
+                server.send_message(msg)
+                server.quit()
+            logger.info("Email sent successfully.")
         except Exception as e:
-            print(f"Failed to send email: {e}")
+            logger.error("Failed to send email: %s", e)
+
+
+class QuoteCache:
+    """
+    Thread-safe TTL cache of ticker prices, optionally persisted to disk so
+    a restart within the TTL does not refetch.
+    """
+
+    DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "quotes.json")
+
+    def __init__(self, ttl=60, path=DEFAULT_PATH):
+        """
+        :param ttl: seconds a cached price stays valid
+        :param path: JSON file used to persist the cache (None to disable)
+        """
+        self.ttl = ttl
+        self.path = path
+        self._entries = {}
+        self._lock = threading.Lock()
+        if self.path:
+            self.load()
+            atexit.register(self.save)
+
+    def get(self, ticker):
+        """
+        Return the cached price, or None if missing or expired.
+        """
+        with self._lock:
+            entry = self._entries.get(ticker)
+        if entry is None:
+            return None
+        price, expiry = entry
+        if expiry <= time.time():
+            return None
+        return price
+
+    def set(self, ticker, price):
+        """
+        Cache a price for the configured TTL.
+        """
+        with self._lock:
+            self._entries[ticker] = (price, time.time() + self.ttl)
+
+    def load(self):
+        """
+        Load unexpired entries from the JSON file, if any.
+        An unreadable or malformed file is treated as an empty cache.
+        """
+        now = time.time()
+        try:
+            with open(self.path, "rb") as f:
+                entries = _json_loads(f.read())
+            entries = {
+                str(ticker): (float(price), float(expiry))
+                for ticker, (price, expiry) in entries.items()
+                if float(expiry) > now
+            }
+        except (OSError, AttributeError, TypeError, ValueError):
+            return
+        with self._lock:
+            self._entries = entries
+
+    def save(self):
+        """
+        Write unexpired entries to the JSON file.
+        """
+        now = time.time()
+        with self._lock:
+            entries = {t: e for t, e in self._entries.items() if e[1] > now}
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(self.path, "wb") as f:
+                f.write(_json_dumps(entries))
+        except OSError:
+            pass
 
 
 class MarketDataFetcher:
@@ -133,29 +342,122 @@ class MarketDataFetcher:
     Fetches pre-market rates for tickers from Yahoo Finance.
     """
 
+    MAX_WORKERS = 10
+    TIMEOUT = (3.05, 10)  # (connect, read) seconds
+    CHART_URL = "https://query1.finance.yahoo.com/v8/finance/chart/{sym}"
+    CHART_PARAMS = {"interval": "1m", "range": "1d", "includePrePost": "true"}
+
+    def __init__(self, cache=None):
+        self.cache = cache if cache is not None else QuoteCache(path=None)
+        self._inflight = {}
+        self._inflight_lock = threading.Lock()
+
     def fetch(self, ticker_list):
+        """
+        Fetch pre-market prices for an iterable of (ticker, avg_buy_rate)
+        pairs, such as a TickerList.
+        Cached prices are returned directly; the rest are looked up
+        concurrently from the chart endpoint.
+        Returns a dict of ticker -> price (None if unavailable).
+        """
         market_data = {}
-        for ticker, _ in ticker_list:
-            try:
-                stock = yf.Ticker(ticker)
-                # Get the latest pre-market price if available, else use last close
-                premarket = stock.info.get("preMarketPrice")
-                market_data[ticker] = premarket #price
-            except Exception as e:
-                market_data[ticker] = None
+        pending = []
+        # Duplicate symbols (e.g. multiple lots) share one lookup
+        for ticker in dict.fromkeys(ticker for ticker, _ in ticker_list):
+            price = self.cache.get(ticker)
+            if price is None:
+                pending.append(ticker)
+            else:
+                market_data[ticker] = price
+        if not pending:
+            return market_data
+
+        fetched = {}
+        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+            futures = {}
+            for ticker in pending:
+                futures.setdefault(self._submit(executor, ticker), ticker)
+            for future in as_completed(futures):
+                ticker = futures[future]
+                try:
+                    fetched[ticker] = future.result()
+                except requests.RequestException as e:
+                    # Raised only once the session's Retry policy is exhausted
+                    logger.warning("Failed to fetch %s: %s", ticker, e)
+                    fetched[ticker] = None
+
+        for ticker, price in fetched.items():
+            if price is not None:
+                self.cache.set(ticker, price)
+        market_data.update(fetched)
         return market_data
 
+    def _submit(self, executor, ticker):
+        """
+        Submit a lookup for ticker, reusing the in-flight future if an
+        identical request is already running.
+        """
+        with self._inflight_lock:
+            future = self._inflight.get(ticker)
+            if future is not None:
+                return future
+            future = executor.submit(self._chart, _SESSION, ticker)
+            self._inflight[ticker] = future
+        # Registered outside the lock: the callback runs immediately if the
+        # future has already finished, and it takes the lock itself
+        future.add_done_callback(lambda f: self._forget(ticker, f))
+        return future
+
+    def _forget(self, ticker, future):
+        """
+        Drop a finished future from the in-flight map, whatever its outcome.
+        """
+        with self._inflight_lock:
+            if self._inflight.get(ticker) is future:
+                del self._inflight[ticker]
+
+    @classmethod
+    def _chart(cls, session, ticker):
+        """
+        Fetch the pre-market price for a single ticker from Yahoo's chart endpoint.
+        Uses the last 1-minute close inside the current pre-market session;
+        returns None if that session has no bars yet.
+        """
+        response = session.get(
+            cls.CHART_URL.format(sym=ticker),
+            params=cls.CHART_PARAMS,
+            timeout=cls.TIMEOUT,
+        )
+        try:
+            result = _json_loads(response.content)["chart"]["result"][0]
+            pre = result["meta"]["currentTradingPeriod"]["pre"]
+            start, end = pre["start"], pre["end"]
+            timestamps = result.get("timestamp") or []
+            closes = result["indicators"]["quote"][0].get("close") or []
+            for ts, close in zip(reversed(timestamps), reversed(closes)):
+                if close is not None and start <= ts < end:
+                    return close
+            return None
+        except (KeyError, IndexError, TypeError, ValueError):
+            return None
+
+
 class TimeWindowScheduler:
     """
     Waits for and triggers actions at specified time windows.
     """
 
+    TICK_SECONDS = 30.0
+
     def __init__(self, run_times=None):
        
+        self._stop = threading.Event()
         if run_times is None:
-            print("No schedule run time available")
+            logger.warning("No schedule run time available")
         else:
             self.run_times = run_times
+            # Parse HH:MM once; candidates are built with datetime.replace
+            self._hm = [tuple(int(x) for x in t.split(":")) for t in run_times]
 
     def get_next_run_time(self):
         """
@@ -163,27 +465,42 @@ class TimeWindowScheduler:
         """
         now = datetime.now()
         today_times = [
-            datetime.strptime(f"{now.date()} {t}", "%Y-%m-%d %H:%M")
-            for t in self.run_times
+            now.replace(hour=h, minute=m, second=0, microsecond=0)
+            for h, m in self._hm
         ]
         future_times = [t for t in today_times if t > now]
         if future_times:
             return min(future_times)
         # If all times have passed, schedule for the first time tomorrow
         tomorrow = now + timedelta(days=1)
-        next_time = datetime.strptime(f"{tomorrow.date()} {self.run_times[0]}", "%Y-%m-%d %H:%M")
+        h, m = self._hm[0]
+        next_time = tomorrow.replace(hour=h, minute=m, second=0, microsecond=0)
         return next_time
 
     def wait_for_next_window(self):
         """
         Blocks until the next allowed run time.
+        Sleeps in short ticks, re-checking the wall clock each time so system
+        sleep or clock changes do not cause drift.
+        Returns False if stop() was called before the window was reached.
         """
         next_run = self.get_next_run_time()
-        wait_seconds = (next_run - datetime.now()).total_seconds()
-        if wait_seconds > 0:
-            print(f"Waiting until next run window at {next_run.strftime('%H:%M')}...")
-            time.sleep(wait_seconds)
-        print(f"Time window reached: {next_run.strftime('%H:%M')}")
+        if (next_run - datetime.now()).total_seconds() > 0:
+            logger.info("Waiting until next run window at %s...", next_run.strftime('%H:%M'))
+        while True:
+            remaining = (next_run - datetime.now()).total_seconds()
+            if remaining <= 0:
+                break
+            if self._stop.wait(timeout=min(remaining, self.TICK_SECONDS)):
+                return False
+        logger.info("Time window reached: %s", next_run.strftime('%H:%M'))
+        return True
+
+    def stop(self):
+        """
+        Wake any pending wait_for_next_window() call, e.g. from a signal handler.
+        """
+        self._stop.set()
 
 
 class TickerFileManager:
@@ -191,6 +508,16 @@ class TickerFileManager:
     Handles reading and validating the CSV file with tickers.
     """
 
+    CHUNK_SIZE = 10000
+    _READ_OPTIONS = dict(
+        header=None,
+        skiprows=1,  # Skip the header row
+        dtype=str,
+        keep_default_na=False,
+        skip_blank_lines=True,
+        chunksize=CHUNK_SIZE,
+    )
+
     def __init__(self):
         self.file_path = None
 
@@ -203,31 +530,53 @@ class TickerFileManager:
         """
         Check if the file exists and is a CSV file.
         """
-        if not self.file_path or not os.path.isfile(self.file_path):
-            print("Error: File does not exist.")
+        try:
+            is_file = bool(self.file_path) and stat.S_ISREG(os.stat(self.file_path).st_mode)
+        except OSError:
+            is_file = False
+        if not is_file:
+            logger.error("File does not exist.")
             return False
-        if not self.file_path.lower().endswith('.csv'):
-            print("Error: File is not a CSV.")
+        if self.file_path[-4:].lower() != '.csv':
+            logger.error("File is not a CSV.")
             return False
-        if  self.file_path and os.path.isfile(self.file_path):
-            print("Ticker file found.")
-            return True
+        logger.info("Ticker file found.")
+        return True
+
+    def iter_tickers(self):
+        """
+        Yield (ticker, avg_buy_rate) tuples from the CSV file one row at a time.
+        Assumes each ticker is on a separate line or in the first column.
+        """
+        try:
+            # Columns are picked by position, so a narrow header does not hide
+            # the avg buy rate column and extra fields are ignored
+            chunks = pd.read_csv(self.file_path, engine="c", usecols=[0, 1], **self._READ_OPTIONS)
+        except pd.errors.EmptyDataError:
+            return
+        except ValueError:
+            # The first data row has no second field, so the C reader cannot
+            # select column 1. Fall back to the python engine, which pads
+            # short rows and truncates long ones to two fields.
+            chunks = pd.read_csv(
+                self.file_path,
+                engine="python",
+                names=["ticker", "avg_buy_rate"],
+                on_bad_lines=lambda row: row[:2],
+                **self._READ_OPTIONS,
+            )
+        for chunk in chunks:
+            chunk = chunk.fillna("")
+            tickers = chunk.iloc[:, 0].str.strip().str.upper()
+            avg_buy_rates = chunk.iloc[:, 1].str.strip()
+            mask = tickers != ""
+            yield from zip(tickers[mask], avg_buy_rates[mask])
 
     def read_tickers(self):
         """
         Read and return a list of tickers from the CSV file.
-        Assumes each ticker is on a separate line or in the first column.
         """
-        tickers = []
-        with open(self.file_path, newline='') as csvfile:
-            reader = csv.reader(csvfile)
-            next(reader, None)  # Skip the header row
-            for row in reader:
-                if row and row[0].strip():
-                    ticker = row[0].strip().upper()
-                    your_avg_buy_rate = row[1].strip() if len(row) > 1 else ""
-                    tickers.append((ticker, your_avg_buy_rate))
-        return tickers
+        return list(self.iter_tickers())
     
 class TickerList:
     """
@@ -236,28 +585,50 @@ class TickerList:
 
     def __init__(self, tickers=None):
         """
-        Initialize with a list of tickers.
+        Initialize from an iterable of (ticker, avg_buy_rate) tuples.
+        Tickers and avg buy rates are kept as parallel tuples and are fixed
+        after construction; build a new TickerList to change them.
+        """
+        symbols = []
+        avg_rates = []
+        for ticker, your_avg_buy_rate in (tickers if tickers is not None else ()):
+            symbols.append(ticker)
+            avg_rates.append(your_avg_buy_rate)
+        self.symbols = tuple(symbols)
+        self.avg_rates = tuple(avg_rates)
+
+    @property
+    def tickers(self):
+        """
+        Return a tuple of (ticker, avg_buy_rate) pairs.
         """
-        self.tickers = tickers if tickers is not None else []
+        return tuple(zip(self.symbols, self.avg_rates))
 
     def count(self):
         """
         Return the number of tickers.
         """
-        return len(self.tickers)
+        return len(self.symbols)
 
     def __iter__(self):
         """
-        Allow iteration over tickers.
+        Allow iteration over (ticker, avg_buy_rate) tuples.
+        """
+        return zip(self.symbols, self.avg_rates)
+
+    @cached_property
+    def unique_symbols(self):
+        """
+        Return the distinct tickers in first-seen order.
         """
-        return iter(self.tickers)
+        return tuple(dict.fromkeys(self.symbols))
 
     def display(self):
         """
         Print all tickers.
         """
         print("Tickers in the list:")
-        for ticker, your_avg_buy_rate in self.tickers:
+        for ticker, your_avg_buy_rate in self:
             print(f"{ticker} - {your_avg_buy_rate}")   
 
 email_alert = EmailAlert(
@@ -273,13 +644,13 @@ infobip_sms = InfobipSmsAlert(
 )
 
 if __name__ == "__main__":
-
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
 
     manager = TickerFileManager()
     manager.prompt_for_path()
 
     if not manager.validate_file():
-        print("Exiting due to invalid file.")
+        logger.error("Exiting due to invalid file.")
     else:
 
         # Define US market close time (16:00 or 4:00 PM Eastern Time)
@@ -289,7 +660,7 @@ if __name__ == "__main__":
         now = datetime.now()
         pre_market_close_today = now.replace(hour=pre_market_close_hour, minute=pre_market_close_minute, second=0, microsecond=0)
         if now > pre_market_close_today:
-            print("Warning: Pre-market hours closed. No pre-market data available.")
+            logger.warning("Pre-market hours closed. No pre-market data available.")
             email_alert.send(to_email="TO_EMAIL_ADDRESS",subject="Pre-market Alert",body="Warning: Pre-market hours closed. No pre-market data available.")
             infobip_sms.send_infobip_sms(
             sender="InfoSMS",
@@ -303,33 +674,41 @@ if __name__ == "__main__":
         
         run_times =  ["6:00", "6:30", "7:00"] #local time in HH:MM format
         scheduler = TimeWindowScheduler(run_times=run_times)
+        # One fetcher for all windows keeps its cache and session warm
+        fetcher = MarketDataFetcher(cache=QuoteCache())
+        ticker_list = None
+        tickers_mtime = None
         # Loop only for the number of defined run times
-        for _ in run_times:
-            scheduler.wait_for_next_window()  # Wait until the next allowed time window
-            tickers = manager.read_tickers()
-            ticker_list = TickerList(tickers)
+        # Keep one SMTP session open across all windows
+        with email_alert:
+            for _ in run_times:
+                if not scheduler.wait_for_next_window():  # Wait until the next allowed time window
+                    break
+                # Re-read the ticker file only if it changed since the last window
+                mtime = os.stat(manager.file_path).st_mtime
+                if mtime != tickers_mtime:
+                    ticker_list = TickerList(manager.iter_tickers())
+                    tickers_mtime = mtime
             
-            # Fetch market data for tickers
-            fetcher = MarketDataFetcher()
-            market_data = fetcher.fetch(ticker_list)
+                # Fetch market data for tickers
+                market_data = fetcher.fetch(ticker_list)
               
-            date_str = datetime.now().strftime("%d-%b-%Y")
-            ticker_data = []
-            for ticker, your_avg_buy_rate in ticker_list:
-                price = market_data.get(ticker)
-                ticker_data.append((ticker, your_avg_buy_rate, price))
-
-            # Build subject and body using the template class
-            subject = EmailTemplate.build_subject(date_str)
-            html_body = EmailTemplate.build_html_body(date_str, ticker_data, ticker_list.count())
-
-
-            # Send email
-            email_alert.send(
-                to_email="TO_EMAIL_ADDRESS",
-                subject=subject,
-                html_body=html_body
-            )
+                date_str = datetime.now().strftime("%d-%b-%Y")
+                prices = [market_data.get(ticker) for ticker in ticker_list.symbols]
+
+                # Build subject and body using the template class
+                subject = EmailTemplate.build_subject(date_str)
+                html_body = EmailTemplate.build_html_body(
+                    date_str, ticker_list.symbols, ticker_list.avg_rates, prices, ticker_list.count()
+                )
+
+
+                # Send email
+                email_alert.send(
+                    to_email="TO_EMAIL_ADDRESS",
+                    subject=subject,
+                    html_body=html_body
+                )
 
-            print("Waiting for the next time window...\n")
-        print("All scheduled runs for today are complete. Please restart the program tomorrow.")
+                logger.info("Waiting for the next time window...")
+        logger.info("All scheduled runs for today are complete. Please restart the program tomorrow.")